@@ -1,62 +1,132 @@
+import orjson
 import requests
+import random
+import threading
 import time
-import json
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
-from config import ENDPOINTS
+from config import ENDPOINTS, BACKOFF_CAP, TOKEN_REFRESH_BUFFER, MARKET_CHECK_INTERVAL
 
 console = Console()
 
 class HappyHarvestAPI:
     """API client for HappyHarvest farming game"""
     
+    __slots__ = ('client_id', 'client_secret', 'access_token', '_token_expires_monotonic',
+                 '_token_lock', '_response_cache', '_etags', '_body_cache', '_adapter',
+                 '_session_headers', '_local', '_auth_headers', '_executor')
+    
     def __init__(self, client_id: str = "", client_secret: str = ""):
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = ""
-        self.token_expires_at = datetime.now()
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._token_expires_monotonic = 0.0
+        self._token_lock = threading.Lock()
+        self._response_cache: Dict[str, Tuple[float, Dict]] = {}  # endpoint -> (fetched_at, body)
+        self._etags: Dict[str, str] = {}       # url -> last ETag seen on a GET
+        self._body_cache: Dict[str, Dict] = {}  # url -> body that ETag describes
+        # Keep-alive pool shared by all bot threads; transient 5xx responses are retried
+        # here, while connection errors fall through to the jittered loop in _make_request
+        self._adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, connect=0, read=0, backoff_factor=0.5,
+                              status_forcelist=(500, 502, 503, 504),
+                              allowed_methods=frozenset(['GET', 'POST']),
+                              respect_retry_after_header=True,
+                              raise_on_status=False))
+        self._session_headers = {
             'Content-Type': 'application/json',
             'User-Agent': 'HappyHarvest-Bot/1.0'
-        })
+        }
+        self._local = threading.local()  # per-thread Session + dispatch table
+        self._auth_headers = {}  # rebuilt only when the token changes
+        # Workers for fanning out independent GETs over the shared connection pool
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='happyharvest-api')
     
-    def _make_request(self, method: str, url: str, data: Dict = None, 
+    def _senders(self) -> Dict[str, Any]:
+        """GET/POST dispatch for the calling thread's own Session over the shared adapter"""
+        senders = getattr(self._local, 'senders', None)
+        if senders is None:
+            # requests.Session isn't documented as thread-safe, but the adapter's pool is
+            session = requests.Session()
+            session.headers.update(self._session_headers)
+            session.mount('https://', self._adapter)
+            # Methods are passed upper-case by convention; no per-request normalisation
+            senders = self._local.senders = {'GET': session.get, 'POST': session.post}
+        return senders
+    
+    def _make_request(self, method: str, url: str, data: Optional[Dict] = None, 
                      auth_required: bool = False, retry_count: int = 3) -> Dict:
         """Make HTTP request with error handling and retries"""
-        if auth_required and not self._is_token_valid():
-            if not self.refresh_token():
-                raise Exception("Failed to refresh token")
+        if auth_required and not self._ensure_token():
+            raise Exception("Failed to refresh token")
+        
+        send = self._senders().get(method)
+        if send is None:
+            raise ValueError(f"Unsupported method: {method}")
+        headers = self._auth_headers if auth_required else None
+        # Encoded once with orjson; the session already sends Content-Type: application/json
+        body = orjson.dumps(data) if data is not None else None
         
-        headers = {}
-        if auth_required:
-            headers['Authorization'] = f'Bearer {self.access_token}'
+        # Conditional GET: an unchanged resource comes back as a bodyless 304
+        etag = self._etags.get(url) if method == 'GET' else None
+        if etag:
+            headers = {**(headers or {}), 'If-None-Match': etag}
         
         for attempt in range(retry_count):
             try:
-                if method.upper() == 'GET':
-                    response = self.session.get(url, headers=headers, timeout=10)
-                elif method.upper() == 'POST':
-                    response = self.session.post(url, json=data, headers=headers, timeout=10)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-                
+                response = send(url, data=body, headers=headers, timeout=10)
+                if etag and response.status_code == 304:
+                    return self._body_cache[url]
                 response.raise_for_status()
-                return response.json()
+                result = orjson.loads(response.content)
+                
+                if method == 'GET' and 'ETag' in response.headers:
+                    self._body_cache[url] = result
+                    self._etags[url] = response.headers['ETag']
+                return result
                 
+            except requests.exceptions.HTTPError:
+                # Status-code retries already happened in the session adapter
+                raise
             except requests.exceptions.RequestException as e:
                 console.print(f"[red]Request failed (attempt {attempt + 1}/{retry_count}): {e}[/red]")
                 if attempt == retry_count - 1:
                     raise
-                time.sleep(2 ** attempt)  # Exponential backoff
+                # Exponential backoff with full jitter so concurrent callers don't retry in lockstep
+                time.sleep(random.uniform(0, min(BACKOFF_CAP, 2 ** attempt)))
         
         raise Exception("Max retries exceeded")
     
+    def _cached_get(self, endpoint: str, max_age: float) -> Dict:
+        """GET a public endpoint, reusing the last response if it is younger than max_age seconds"""
+        now = time.monotonic()
+        cached = self._response_cache.get(endpoint)
+        if cached and now - cached[0] < max_age:
+            return cached[1]
+        
+        result = self._make_request('GET', ENDPOINTS[endpoint])
+        self._response_cache[endpoint] = (now, result)
+        return result
+    
     def _is_token_valid(self) -> bool:
         """Check if current token is still valid"""
-        return (self.access_token and 
-                datetime.now() < self.token_expires_at - timedelta(minutes=1))
+        return (bool(self.access_token) and 
+                time.monotonic() < self._token_expires_monotonic - TOKEN_REFRESH_BUFFER)
+    
+    def _ensure_token(self) -> bool:
+        """Refresh the token if it is missing or about to expire"""
+        if self._is_token_valid():
+            return True
+        with self._token_lock:
+            # Another thread may have refreshed it while we were waiting
+            if self._is_token_valid():
+                return True
+            return self.refresh_token()
     
     def register_farmer(self, farmer_name: str) -> Dict:
         """Register a new farmer (ONE TIME ONLY!)"""
@@ -89,9 +159,11 @@ class HappyHarvestAPI:
         
         if 'access_token' in result:
             self.access_token = result['access_token']
+            self._auth_headers = {'Authorization': f'Bearer {self.access_token}'}
             expires_in = result.get('expires_in', 300)  # Default 5 minutes
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-            console.print(f"[green]🔑 Token obtained, expires at {self.token_expires_at.strftime('%H:%M:%S')}[/green]")
+            self._token_expires_monotonic = time.monotonic() + expires_in
+            expires_at = datetime.now() + timedelta(seconds=expires_in)  # wall clock for display only
+            console.print(f"[green]🔑 Token obtained, expires at {expires_at.strftime('%H:%M:%S')}[/green]")
         
         return result
     
@@ -124,9 +196,20 @@ class HappyHarvestAPI:
         """View your farming land"""
         return self._make_request('GET', ENDPOINTS['land'], auth_required=True)
     
-    def get_crops(self) -> Dict:
-        """Get crop data with live market pricing"""
-        return self._make_request('GET', ENDPOINTS['crops'])
+    def get_crops(self, max_age: float = MARKET_CHECK_INTERVAL) -> Dict:
+        """Get crop data with live market pricing (cached for max_age seconds)"""
+        return self._cached_get('crops', max_age)
+    
+    def get_farm_state(self) -> Tuple[Dict, Dict, Dict]:
+        """Fetch profile, land and crops concurrently (one round-trip of wall time)"""
+        # Refresh up front so the parallel requests don't all queue on the token lock
+        if not self._ensure_token():
+            raise Exception("Failed to refresh token")
+        
+        profile = self._executor.submit(self.get_profile)
+        land = self._executor.submit(self.get_land)
+        crops = self._executor.submit(self.get_crops)
+        return profile.result(), land.result(), crops.result()
     
     def plant_crop(self, crop_type: str, row: int, col: int) -> Dict:
         """Plant a crop on your land"""
@@ -145,6 +228,6 @@ class HappyHarvestAPI:
         }
         return self._make_request('POST', ENDPOINTS['harvest'], data, auth_required=True)
     
-    def get_leaderboard(self) -> Dict:
-        """Get current farmer rankings"""
-        return self._make_request('GET', ENDPOINTS['leaderboard']) 
\ No newline at end of file
+    def get_leaderboard(self, max_age: float = MARKET_CHECK_INTERVAL) -> Dict:
+        """Get current farmer rankings (cached for max_age seconds)"""
+        return self._cached_get('leaderboard', max_age) 
\ No newline at end of file
@@ -2,7 +2,9 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Skip parsing .env when the environment already carries everything it would provide
+if not all(key in os.environ for key in ('FARMER_NAME', 'CLIENT_ID', 'CLIENT_SECRET')):
+    load_dotenv(override=False)
 
 # API Base URL
 BASE_URL = "https://happyharvest.fun"
@@ -24,14 +26,19 @@ ENDPOINTS = {
 
 # Timing Constants (in seconds)
 WATER_COLLECTION_INTERVAL = 30  # Collect water every 30 seconds
-TOKEN_REFRESH_INTERVAL = 240    # Refresh token every 4 minutes (5min expiry - 1min buffer)
+TOKEN_REFRESH_BUFFER = 120      # Refresh token inline when it has less than 2 minutes left
 CROP_CHECK_INTERVAL = 30       # Check crops every 30 seconds for competitive mode
+CROP_CHECK_MIN_INTERVAL = 5    # Adaptive crop checks never come sooner than this...
+CROP_CHECK_MAX_INTERVAL = 120  # ...or later than this
 MARKET_CHECK_INTERVAL = 65     # Check market prices every 65 seconds
+STATE_REFRESH_INTERVAL = 180   # Re-fetch profile/land at least this often even when nothing changed
+BACKOFF_CAP = 30               # Upper bound on retry backoff sleeps
 
 # Game Constants
 MAX_WATER_CAPACITY = 1024
 LAND_CLAIM_COST = 5
 WATER_WASTE_PENALTY = 10
+MAX_CONCURRENT_ACTIONS = 4      # Plan actions sent to the API in parallel
 
 # Strategy Constants
 MIN_WATER_RESERVE = 1          # ULTRA-AGGRESSIVE: Keep only 1 water for emergency victory mode
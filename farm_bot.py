@@ -1,15 +1,22 @@
+import os
+import random
 import time
+import heapq
 import threading
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+import requests
 from rich.console import Console
 from rich.table import Table
 from rich.live import Live
 from rich.panel import Panel
 from rich.layout import Layout
+from rich.text import Text
 
 from api_client import HappyHarvestAPI
-from farming_strategy import FarmingStrategy
+from farming_strategy import FarmingStrategy, Action
 from config import *
 
 console = Console()
@@ -25,7 +32,6 @@ class HappyHarvestBot:
         # Bot state
         self.running = False
         self.last_water_collection = None
-        self.last_token_refresh = None
         self.last_crop_check = None
         self.last_market_check = None
         
@@ -33,6 +39,10 @@ class HappyHarvestBot:
         self.current_profile = {}
         self.current_land = {}
         self.current_crops = {}
+        self._state_dirty = True  # profile/land may have changed since the last fetch
+        self._last_state_fetch = 0.0
+        self._ready_at = {}  # (row, col) -> monotonic time a crop we planted should mature
+        self._plan_failed = False  # an action in the last plan was rejected or errored
         self.stats = {
             'water_collected': 0,
             'crops_planted': 0,
@@ -41,10 +51,18 @@ class HappyHarvestBot:
             'total_credits_earned': 0,
             'start_time': datetime.now()
         }
+        self._start_monotonic = time.monotonic()
         
-        # Threading
-        self.main_thread = None
+        # Scheduling
         self.stop_event = threading.Event()
+        self._action_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ACTIONS,
+                                               thread_name_prefix='happyharvest-action')
+        
+        # Status display
+        self._event_log = deque(maxlen=50)  # (timestamp, markup) rendered by the Live display
+        self._farm_key = None  # inputs the farm table rows were last formatted from
+        self._runtime_seconds = 0
+        self._build_status_display()
     
     def register_or_login(self) -> bool:
         """Register new farmer or login with existing credentials"""
@@ -82,188 +100,371 @@ LOG_LEVEL=INFO
 """
         with open('.env', 'w') as f:
             f.write(env_content)
+        
+        # Make the new credentials live for this process too, no restart needed
+        os.environ['FARMER_NAME'] = self.farmer_name
+        os.environ['CLIENT_ID'] = client_id
+        os.environ['CLIENT_SECRET'] = client_secret
+        self.api.client_id = client_id
+        self.api.client_secret = client_secret
         console.print(f"[cyan]💾 Credentials saved to .env file[/cyan]")
     
-    def collect_water_cycle(self):
-        """Main water collection cycle - runs every 30 seconds"""
-        while not self.stop_event.is_set():
-            try:
-                # Collect water
-                result = self.api.collect_water()
-                
-                if 'score' in result:
-                    self.stats['water_collected'] += 1
-                    console.print(f"[green]💧 Water collected! Score: {result['score']} (+1)[/green]")
-                elif 'error' in result:
-                    console.print(f"[red]⚠️ Water collection issue: {result.get('error_description', 'Unknown')}[/red]")
-                else:
-                    console.print(f"[yellow]⚠️ {result.get('message', 'Unknown response')}[/yellow]")
-                
-                self.last_water_collection = datetime.now()
-                
-            except Exception as e:
-                console.print(f"[red]❌ Water collection failed: {e}[/red]")
+    def _log_event(self, message: str):
+        """Record an event for the status display instead of printing over the Live view"""
+        self._event_log.append((datetime.now(), message))
+    
+    def collect_water_cycle(self) -> float:
+        """Water collection cycle - returns the monotonic time of the next collection"""
+        started = time.monotonic()
+        if self.current_profile.get('score', 0) >= MAX_WATER_CAPACITY:
+            # Collecting at capacity only wastes water; wait for the farming cycle to spend some
+            return started + WATER_COLLECTION_INTERVAL
+        
+        retry_after = None
+        try:
+            # Collect water
+            result = self.api.collect_water()
+            retry_after = self._server_retry_delay(result)
             
-            # Wait exactly 30 seconds
-            self.stop_event.wait(WATER_COLLECTION_INTERVAL)
+            if 'score' in result:
+                self.stats['water_collected'] += 1
+                # Keep the cached profile current without another GET /profile
+                self.current_profile = {**self.current_profile, 'score': result['score']}
+                self._log_event(f"[green]💧 Water collected! Score: {result['score']} (+1)[/green]")
+            elif 'error' in result:
+                self._log_event(f"[red]⚠️ Water collection issue: {result.get('error_description', 'Unknown')}[/red]")
+            else:
+                self._log_event(f"[yellow]⚠️ {result.get('message', 'Unknown response')}[/yellow]")
+            
+            self.last_water_collection = time.monotonic()
+            
+        except requests.exceptions.HTTPError as e:
+            # Rate limited: the server says when the next collection is allowed
+            retry_after = self._server_retry_delay({'retryAfter': e.response.headers.get('Retry-After')})
+            self._log_event(f"[red]❌ Water collection failed: {e}[/red]")
+        except Exception as e:
+            self._log_event(f"[red]❌ Water collection failed: {e}[/red]")
+        
+        if retry_after is not None:
+            # Wait out the server's window instead of retrying on our own (possibly drifted) clock;
+            # jittered so we don't land exactly on the release edge. The window is measured from
+            # the response, so it counts from now rather than from when the call was sent
+            return time.monotonic() + max(1, retry_after + random.uniform(0, 1))
+        
+        # Exactly 30 seconds after this collection was sent
+        return started + WATER_COLLECTION_INTERVAL
     
-    def token_refresh_cycle(self):
-        """Token refresh cycle - runs every 4 minutes"""
-        while not self.stop_event.is_set():
-            try:
-                if self.api.refresh_token():
-                    self.last_token_refresh = datetime.now()
-                    console.print(f"[blue]🔄 Token refreshed successfully[/blue]")
-            except Exception as e:
-                console.print(f"[red]❌ Token refresh failed: {e}[/red]")
+    @staticmethod
+    def _server_retry_delay(result: Dict) -> Optional[float]:
+        """Seconds until the server allows the next call, if the response says so"""
+        try:
+            if result.get('retryAfter') is not None:
+                return float(result['retryAfter'])
             
-            # Wait 4 minutes
-            self.stop_event.wait(TOKEN_REFRESH_INTERVAL)
+            next_collect = result.get('nextCollectAt')
+            if isinstance(next_collect, str):
+                next_at = datetime.fromisoformat(next_collect.replace('Z', '+00:00'))
+                return (next_at - datetime.now(timezone.utc)).total_seconds()
+            if isinstance(next_collect, (int, float)):
+                # Epoch timestamp, in milliseconds if it is too large to be seconds
+                epoch = next_collect / 1000 if next_collect > 1e12 else next_collect
+                return epoch - time.time()
+        except (TypeError, ValueError):
+            pass
+        return None
     
-    def farming_cycle(self):
-        """Main farming cycle - checks crops and executes farming strategy"""
-        while not self.stop_event.is_set():
-            try:
-                # Get current game state
-                self.current_profile = self.api.get_profile()
-                self.current_land = self.api.get_land()
+    def farming_cycle(self) -> float:
+        """Farming cycle - checks crops and executes farming strategy, returns the monotonic time of the next check"""
+        started = time.monotonic()
+        try:
+            if self._needs_state_refresh():
+                # Get current game state (independent GETs fetched concurrently)
+                self.current_profile, self.current_land, self.current_crops = self.api.get_farm_state()
+                self.strategy.attach_land(self.current_land)
+                self._state_dirty = False
+                self._last_state_fetch = time.monotonic()
+            else:
+                # Profile and land are unchanged since the last fetch; only prices can move
                 self.current_crops = self.api.get_crops()
-                
-                # Get farming plan
-                plan = self.strategy.get_farming_plan(
-                    self.current_profile, 
-                    self.current_land, 
-                    self.current_crops
-                )
-                
-                # Execute farming actions
-                self._execute_farming_plan(plan)
-                
-                self.last_crop_check = datetime.now()
-                
-            except Exception as e:
-                console.print(f"[red]❌ Farming cycle error: {e}[/red]")
             
-            # Wait 1 minute
-            self.stop_event.wait(CROP_CHECK_INTERVAL)
+            # Get farming plan
+            plan = self.strategy.get_farming_plan(
+                self.current_profile, 
+                self.current_land, 
+                self.current_crops
+            )
+            
+            # Execute farming actions
+            self._execute_farming_plan(plan)
+            
+            self.last_crop_check = time.monotonic()
+            
+        except Exception as e:
+            self._log_event(f"[red]❌ Farming cycle error: {e}[/red]")
+            return started + CROP_CHECK_INTERVAL
+        
+        # Maturity and affordability waits are measured from now, after the plan has run
+        return time.monotonic() + self._next_farming_interval()
+    
+    def _next_farming_interval(self) -> float:
+        """Seconds until the farm is next likely to need attention"""
+        if self._plan_failed:
+            # The same plan would be rebuilt and rejected again - don't retry it at the fast cadence
+            return CROP_CHECK_INTERVAL
+        
+        if self._state_dirty:
+            # Something just changed (e.g. a harvest freed a plot) - follow up quickly
+            return CROP_CHECK_MIN_INTERVAL
+        
+        now = time.monotonic()
+        water = self.current_profile.get('score', 0)
+        crops = self.current_crops.get('crops', [])
+        cheapest = min((crop.get('waterCost', 0) for crop in crops), default=0)
+        waits = []
+        
+        if not self.current_land.get('landClaimed'):
+            waits.append(max(0, LAND_CLAIM_COST - water) * WATER_COLLECTION_INTERVAL)
+        
+        for row_idx, row in enumerate(self.current_land.get('landData', [])):
+            for col_idx, cell in enumerate(row):
+                if cell == 0:
+                    # Empty plot: plantable as soon as we can afford the cheapest crop
+                    waits.append(max(0, cheapest - water) * WATER_COLLECTION_INTERVAL)
+                elif cell == 1:
+                    ready_at = self._ready_at.get((row_idx, col_idx))
+                    waits.append(ready_at - now if ready_at else CROP_CHECK_INTERVAL)
+                else:
+                    waits.append(0)
+        
+        wait = min(waits, default=CROP_CHECK_MAX_INTERVAL)
+        return min(max(wait, CROP_CHECK_MIN_INTERVAL), CROP_CHECK_MAX_INTERVAL)
+    
+    def _needs_state_refresh(self) -> bool:
+        """Whether profile/land must be re-fetched before planning"""
+        if self._state_dirty or time.monotonic() - self._last_state_fetch >= STATE_REFRESH_INTERVAL:
+            return True
+        # Sprouts mature on the server's clock, so growing land is never assumed unchanged
+        return any(1 in row for row in self.current_land.get('landData', []))
+    
+    def _run_scheduler(self, live: Live):
+        """Run all bot cycles from one loop, sleeping until the earliest one is due"""
+        now = time.monotonic()
+        cycles = {'water': self.collect_water_cycle, 'farming': self.farming_cycle}
+        due = [(now, name) for name in cycles]
+        heapq.heapify(due)
+        
+        while self.running:
+            next_due, name = due[0]
+            delay = next_due - time.monotonic()
+            if delay > 0:
+                # Wake at least once a second to tick the running-time cell
+                self.stop_event.wait(min(delay, 1))
+                self._update_runtime_cell()
+                live.refresh()
+                continue
+            
+            # Each cycle returns when it is next due: plain intervals count from its actual start
+            # (never its planned slot), server windows and maturity waits from when they were computed
+            heapq.heapreplace(due, (cycles[name](), name))
+            self.update_status_display()
+            live.refresh()
+    
+    def _send_action(self, action: Action) -> Dict:
+        """Send a single plan action to the API"""
+        action_type = action.type
+        
+        if action_type == 'claim_land':
+            return self.api.claim_land()
+        elif action_type == 'expand_land':
+            return self.api.expand_land()
+        elif action_type == 'plant':
+            return self.api.plant_crop(action.crop['type'], action.row, action.col)
+        elif action_type == 'harvest':
+            return self.api.harvest_crop(action.row, action.col)
+        
+        return {}
     
     def _execute_farming_plan(self, plan: Dict):
         """Execute the farming plan actions"""
         actions = plan.get('actions', [])
+        self._plan_failed = False
         
+        # Claiming/expanding land spends the same water as planting, so those run one at a time
+        # in plan order before any tile action is sent
         for action in actions:
-            try:
-                action_type = action['type']
-                
-                if action_type == 'claim_land':
-                    result = self.api.claim_land()
-                    if 'error' not in result:
-                        console.print(f"[green]🏞️ Land claimed successfully![/green]")
-                        self.stats['land_expansions'] += 1
-                    else:
-                        console.print(f"[red]❌ Land claim failed: {result.get('error_description')}[/red]")
-                
-                elif action_type == 'expand_land':
-                    result = self.api.expand_land()
-                    if 'error' not in result:
-                        console.print(f"[green]🏗️ Land expanded successfully![/green]")
-                        self.stats['land_expansions'] += 1
-                    else:
-                        console.print(f"[red]❌ Land expansion failed: {result.get('error_description')}[/red]")
-                
-                elif action_type == 'plant':
-                    crop = action['crop']
-                    row, col = action['row'], action['col']
-                    result = self.api.plant_crop(crop['type'], row, col)
-                    if 'error' not in result:
-                        console.print(f"[green]🌱 Planted {crop['name']} at ({row},{col})[/green]")
-                        self.stats['crops_planted'] += 1
-                    else:
-                        console.print(f"[red]❌ Planting failed: {result.get('error_description')}[/red]")
-                
-                elif action_type == 'harvest':
-                    row, col = action['row'], action['col']
-                    crop = action['crop']
-                    result = self.api.harvest_crop(row, col)
-                    if 'error' not in result:
-                        credits = result.get('creditsEarned', 0)
-                        console.print(f"[green]🌾 Harvested {crop['name']} at ({row},{col}) for {credits} credits![/green]")
-                        self.stats['crops_harvested'] += 1
-                        self.stats['total_credits_earned'] += credits
-                    else:
-                        console.print(f"[red]❌ Harvest failed: {result.get('error_description')}[/red]")
-                
-                # Small delay between actions
-                time.sleep(1)
-                
-            except Exception as e:
-                console.print(f"[red]❌ Action '{action_type}' failed: {e}[/red]")
+            if action.type not in ('harvest', 'plant'):
+                self._report_action(action, self._action_pool.submit(self._send_action, action))
+        
+        # Harvests and plants touch different tiles, so send them concurrently and report in plan order
+        tile_actions = [action for action in actions if action.type in ('harvest', 'plant')]
+        futures = [self._action_pool.submit(self._send_action, action) for action in tile_actions]
+        for action, future in zip(tile_actions, futures):
+            self._report_action(action, future)
     
-    def create_status_display(self) -> Layout:
-        """Create rich status display"""
-        layout = Layout()
+    def _report_action(self, action: Action, future):
+        """Wait for a submitted action and record its outcome"""
+        action_type = action.type
+        try:
+            result = future.result()
+            if 'error' not in result:
+                self._state_dirty = True
+            else:
+                self._plan_failed = True
+            
+            if action_type == 'claim_land':
+                if 'error' not in result:
+                    self._log_event(f"[green]🏞️ Land claimed successfully![/green]")
+                    self.stats['land_expansions'] += 1
+                else:
+                    self._log_event(f"[red]❌ Land claim failed: {result.get('error_description')}[/red]")
+            
+            elif action_type == 'expand_land':
+                if 'error' not in result:
+                    self._log_event(f"[green]🏗️ Land expanded successfully![/green]")
+                    self.stats['land_expansions'] += 1
+                else:
+                    self._log_event(f"[red]❌ Land expansion failed: {result.get('error_description')}[/red]")
+            
+            elif action_type == 'plant':
+                crop = action.crop
+                row, col = action.row, action.col
+                if 'error' not in result:
+                    self._log_event(f"[green]🌱 Planted {crop['name']} at ({row},{col})[/green]")
+                    grow_minutes = crop.get('growTimeMinutes', crop.get('growTimeHours', 1) * 60)
+                    self._ready_at[(row, col)] = time.monotonic() + grow_minutes * 60
+                    self.stats['crops_planted'] += 1
+                else:
+                    self._log_event(f"[red]❌ Planting failed: {result.get('error_description')}[/red]")
+            
+            elif action_type == 'harvest':
+                row, col = action.row, action.col
+                crop = action.crop
+                if 'error' not in result:
+                    credits = result.get('creditsEarned', 0)
+                    self._log_event(f"[green]🌾 Harvested {crop['name']} at ({row},{col}) for {credits} credits![/green]")
+                    self.stats['crops_harvested'] += 1
+                    self._ready_at.pop((row, col), None)
+                    self.stats['total_credits_earned'] += credits
+                else:
+                    self._log_event(f"[red]❌ Harvest failed: {result.get('error_description')}[/red]")
+            
+        except Exception as e:
+            self._plan_failed = True
+            self._log_event(f"[red]❌ Action '{action_type}' failed: {e}[/red]")
+    
+    def _build_status_display(self):
+        """Build the persistent status tables and layout (rows are filled by update_status_display)"""
+        self._farm_table = Table(title="🚜 Farm Status")
+        self._farm_table.add_column("Metric", style="cyan")
+        self._farm_table.add_column("Value", style="green")
+        
+        self._stats_table = Table(title="📊 Bot Statistics")
+        self._stats_table.add_column("Statistic", style="cyan")
+        self._stats_table.add_column("Count", style="yellow")
+        
+        self._expansion_table = Table(title="🏗️ Land Expansion Analysis")
+        self._expansion_table.add_column("Metric", style="cyan")
+        self._expansion_table.add_column("Value", style="magenta")
+        
+        self._market_table = Table(title="📈 Market Status")
+        self._market_table.add_column("Metric", style="cyan")
+        self._market_table.add_column("Value", style="green")
+        
+        self._events_panel = Panel("", title="📜 Recent Events")
         
+        # Table panes never shrink below their rows (see update_status_display); the events
+        # pane only gets the space left over on short terminals
+        self._table_panes = [
+            (Layout(Panel(table)), table)
+            for table in (self._farm_table, self._stats_table, self._expansion_table, self._market_table)
+        ]
+        self._layout = Layout()
+        self._layout.split_column(
+            *(pane for pane, _ in self._table_panes),
+            Layout(self._events_panel, minimum_size=3)
+        )
+    
+    @staticmethod
+    def _set_table_rows(table: Table, rows: list):
+        """Replace the rows of an existing table in place"""
+        table.rows.clear()
+        for column in table.columns:
+            column._cells.clear()
+        for row in rows:
+            table.add_row(*row)
+    
+    @staticmethod
+    def _format_runtime(seconds: int) -> str:
+        """Format a running time in whole seconds as H:MM:SS"""
+        return f"{seconds // 3600}:{(seconds // 60) % 60:02d}:{seconds % 60:02d}"
+    
+    def update_status_display(self):
+        """Refresh the status tables from the current game state"""
         # Farm status
         water = self.current_profile.get('score', 0)
         land_tiles = self.current_land.get('landTiles', 0)
         grid_size = self.current_land.get('gridSize', 0)
         total_credits = self.current_profile.get('credits', 0)  # Real credits from API
         
-        farm_table = Table(title="🚜 Farm Status")
-        farm_table.add_column("Metric", style="cyan")
-        farm_table.add_column("Value", style="green")
-        
-        farm_table.add_row("💧 Water", str(water))
-        farm_table.add_row("💰 Credits", f"{total_credits:.2f}")
-        farm_table.add_row("🏞️ Land Size", f"{grid_size}×{grid_size} ({land_tiles} tiles)")
-        farm_table.add_row("⏰ Running Time", str(datetime.now() - self.stats['start_time']).split('.')[0])
+        # Only re-format the farm rows when their inputs changed; runtime ticks on its own
+        farm_key = (water, total_credits, grid_size, land_tiles)
+        if farm_key != self._farm_key:
+            self._farm_key = farm_key
+            self._set_table_rows(self._farm_table, [
+                ("💧 Water", str(water)),
+                ("💰 Credits", f"{total_credits:.2f}"),
+                ("🏞️ Land Size", f"{grid_size}×{grid_size} ({land_tiles} tiles)"),
+                ("⏰ Running Time", self._format_runtime(self._runtime_seconds))
+            ])
+        self._update_runtime_cell()
         
         # Bot statistics
-        stats_table = Table(title="📊 Bot Statistics")
-        stats_table.add_column("Statistic", style="cyan")
-        stats_table.add_column("Count", style="yellow")
-        
-        stats_table.add_row("💧 Water Collected", str(self.stats['water_collected']))
-        stats_table.add_row("🌱 Crops Planted", str(self.stats['crops_planted']))
-        stats_table.add_row("🌾 Crops Harvested", str(self.stats['crops_harvested']))
-        stats_table.add_row("🏗️ Land Expansions", str(self.stats['land_expansions']))
-        stats_table.add_row("💰 Session Credits", f"{self.stats['total_credits_earned']:.2f}")
+        self._set_table_rows(self._stats_table, [
+            ("💧 Water Collected", str(self.stats['water_collected'])),
+            ("🌱 Crops Planted", str(self.stats['crops_planted'])),
+            ("🌾 Crops Harvested", str(self.stats['crops_harvested'])),
+            ("🏗️ Land Expansions", str(self.stats['land_expansions'])),
+            ("💰 Session Credits", f"{self.stats['total_credits_earned']:.2f}")
+        ])
         
         # Expansion analysis
         expansion = self.strategy.get_expansion_recommendation(
             self.current_profile, self.current_land
         )
         
-        expansion_table = Table(title="🏗️ Land Expansion Analysis")
-        expansion_table.add_column("Metric", style="cyan")
-        expansion_table.add_column("Value", style="magenta")
-        
-        expansion_table.add_row("Current Land", f"{expansion['current_tiles']} tiles")
-        expansion_table.add_row("Expansion Cost", f"{expansion['expansion_cost']} water")
-        expansion_table.add_row("Expected ROI", f"{expansion['roi']:.1%}")
-        expansion_table.add_row("Recommendation", 
-                              "✅ EXPAND NOW!" if expansion['should_expand'] 
-                              else "⏳ Wait/Focus crops")
-        expansion_table.add_row("Strategy", expansion['reasoning'])
+        self._set_table_rows(self._expansion_table, [
+            ("Current Land", f"{expansion['current_tiles']} tiles"),
+            ("Expansion Cost", f"{expansion['expansion_cost']} water"),
+            ("Expected ROI", f"{expansion['roi']:.1%}"),
+            ("Recommendation", "✅ EXPAND NOW!" if expansion['should_expand'] 
+                               else "⏳ Wait/Focus crops"),
+            ("Strategy", expansion['reasoning'])
+        ])
         
         # Market info
         market_info = self.current_crops.get('marketInfo', {})
-        market_table = Table(title="📈 Market Status")
-        market_table.add_column("Metric", style="cyan")
-        market_table.add_column("Value", style="green")
-        
-        market_table.add_row("Average Price", f"{market_info.get('averagePrice', 0):.2f}")
-        market_table.add_row("Highest Price", f"{market_info.get('highestPrice', 0):.2f}")
-        market_table.add_row("Best Efficiency", f"{market_info.get('bestEfficiency', 0):.3f}")
-        
-        layout.split_column(
-            Layout(Panel(farm_table)),
-            Layout(Panel(stats_table)),
-            Layout(Panel(expansion_table)),
-            Layout(Panel(market_table))
-        )
+        self._set_table_rows(self._market_table, [
+            ("Average Price", f"{market_info.get('averagePrice', 0):.2f}"),
+            ("Highest Price", f"{market_info.get('highestPrice', 0):.2f}"),
+            ("Best Efficiency", f"{market_info.get('bestEfficiency', 0):.3f}")
+        ])
+        
+        # Panel border, table title, top border, header, header rule and bottom border: 7 lines
+        for pane, table in self._table_panes:
+            pane.minimum_size = table.row_count + 7
         
-        return layout
+        # Recent events (newest last)
+        recent = list(self._event_log)[-10:]
+        self._events_panel.renderable = Text.from_markup(
+            "\n".join(f"[dim]{ts.strftime('%H:%M:%S')}[/dim] {message}" for ts, message in recent)
+        )
+    
+    def _update_runtime_cell(self):
+        """Tick the running-time cell without touching the rest of the display"""
+        seconds = int(time.monotonic() - self._start_monotonic)
+        if seconds != self._runtime_seconds:
+            self._runtime_seconds = seconds
+            self._farm_table.columns[1]._cells[3] = self._format_runtime(seconds)
     
     def start(self):
         """Start the farming bot"""
@@ -273,22 +474,14 @@ LOG_LEVEL=INFO
         console.print(f"[green]🚀 Starting HappyHarvest farming bot for {self.farmer_name}[/green]")
         self.running = True
         
-        # Start background threads
-        threads = [
-            threading.Thread(target=self.collect_water_cycle, daemon=True),
-            threading.Thread(target=self.token_refresh_cycle, daemon=True),
-            threading.Thread(target=self.farming_cycle, daemon=True)
-        ]
-        
-        for thread in threads:
-            thread.start()
-        
-        # Main loop with status display
+        # Single scheduler loop drives water, farming and the status display
+        # (token refresh happens inline in the API client); tables are rebuilt
+        # only after a cycle has run. The tables are edited in place, so only this
+        # thread renders them - no auto-refresh thread racing the edits
+        self.update_status_display()
         try:
-            with Live(self.create_status_display(), refresh_per_second=1) as live:
-                while self.running:
-                    live.update(self.create_status_display())
-                    time.sleep(1)
+            with Live(self._layout, auto_refresh=False) as live:
+                self._run_scheduler(live)
         except KeyboardInterrupt:
             self.stop()
     
@@ -1,30 +1,158 @@
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
-from rich.console import Console
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Tuple, Optional
+import numpy as np
 from config import *
 
-console = Console()
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy scan below is used instead
+    njit = None
+
+# Action priorities, highest first
+PRIORITIES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')
+
+# Water kept back when planting with the land already full
+_FULL_LAND_RESERVE = max(5, MIN_WATER_RESERVE // 3)
+
+# Tiles gained by the first expansions: 1x1 → 2x2, 2x2 → 3x3, 3x3 → 4x4
+_EXPANSION_NEW_TILES = {1: 3, 4: 5, 9: 7}
+# (water kept above the cost, minimum ROI) for 3x3 → 4x4 and for anything larger
+_EXPANSION_THRESHOLDS_3X3 = (MIN_WATER_RESERVE, 0.15)
+_EXPANSION_THRESHOLDS_LARGE = (50, 0.25)
+# Assume average crop: 8 water cost, 0.15 credits, 0.5 hour grow time
+_CREDITS_PER_TILE_PER_HOUR = 0.3
+# Assume 1 water = 0.02 credits (based on water collection rate vs crop values)
+_WATER_TO_CREDITS = 0.02
+
+class CropView(NamedTuple):
+    """The crop fields the strategy scores on, read out of the API dict once"""
+    id: int
+    name: str
+    efficiency: float
+    marketPrice: float
+    waterCost: int
+    growTimeMinutes: float
+
+def _crop_view(crop: Dict) -> CropView:
+    """Wrap one crop dict from the API in a CropView"""
+    return CropView(crop.get('id'), crop.get('name', ''), crop.get('efficiency', 0), crop.get('marketPrice', 0),
+                    crop.get('waterCost', 0), crop.get('growTimeMinutes', crop.get('growTimeHours', 1) * 60))
+
+@dataclass(slots=True)
+class Opportunity:
+    """A crop worth planting, with the reason it was picked"""
+    crop: Dict
+    reason: str
+    priority: str
+    view: CropView
+
+@dataclass(slots=True)
+class HistoricalSnapshot:
+    """One market_history entry: the headline numbers of an analysis, not the analysis itself"""
+    timestamp: int
+    average_price: float
+    average_efficiency: float
+    opportunity_ids: Tuple[int, ...]
+
+@dataclass(slots=True)
+class Action:
+    """A single step of a farming plan"""
+    type: str
+    priority: str
+    description: str
+    row: Optional[int] = None
+    col: Optional[int] = None
+    crop: Optional[Dict] = None
+
+def _vectorize_crops(views: List[CropView]) -> Dict[str, np.ndarray]:
+    """Extract the per-crop numbers used for scoring into parallel arrays (struct-of-arrays)"""
+    # Numeric fields only (everything after id and name), converted in one call
+    table = np.array([view[2:] for view in views], dtype=np.float64).reshape(len(views), 4)
+    efficiency, price, water, grow_minutes = table.T
+    return {'efficiency': efficiency, 'price': price, 'water': water, 'grow_minutes': grow_minutes}
+
+def _crop_scores(soa: Dict[str, np.ndarray]) -> np.ndarray:
+    """Credits per minute for each crop, penalising crops that pay too few total credits"""
+    price = soa['price']
+    grow = soa['grow_minutes']
+    per_minute = np.divide(price, grow, out=np.zeros_like(price), where=grow > 0)
+    # EMERGENCY: prioritize speed, but avoid micro-credit (< 0.5) and small (< 2.0) crops
+    return per_minute * np.select([price < 0.5, price < 2.0], [0.1, 0.5], default=1.0)
+
+def _land_grid(land_data: Dict) -> np.ndarray:
+    """Land grid as a 2-D int8 array (cell values are 0=dirt, 1=sprout, 2+=crop ID)"""
+    grid = land_data.get('_grid_np')
+    if grid is None:  # land_data was not passed through FarmingStrategy.attach_land
+        grid = np.asarray(land_data.get('landData', []), dtype=np.int8)
+    return grid
+
+def _scan_land_loop(grid):
+    """Walk the grid once, collecting empty (row, col) and mature (row, col, crop_id) cells"""
+    rows, cols = grid.shape
+    empty = np.empty((rows * cols, 2), np.int32)
+    mature = np.empty((rows * cols, 3), np.int32)
+    n_empty = 0
+    n_mature = 0
+    for r in range(rows):
+        for c in range(cols):
+            cell = grid[r, c]
+            if cell == 0:
+                empty[n_empty, 0] = r
+                empty[n_empty, 1] = c
+                n_empty += 1
+            elif cell >= 2:
+                mature[n_mature, 0] = r
+                mature[n_mature, 1] = c
+                mature[n_mature, 2] = cell
+                n_mature += 1
+    return empty[:n_empty], mature[:n_mature]
+
+def _scan_land_numpy(grid):
+    """Same result as _scan_land_loop using two vectorized passes"""
+    ripe = grid >= 2
+    mature = np.column_stack((np.argwhere(ripe), grid[ripe]))
+    return np.argwhere(grid == 0).astype(np.int32), mature.astype(np.int32)
+
+_scan_land_kernel = njit(cache=True)(_scan_land_loop) if njit else _scan_land_numpy
+
+def _scan_land(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Classify the land grid in a single pass (JIT-compiled when numba is installed)"""
+    if grid.ndim != 2 or grid.size == 0:
+        return np.empty((0, 2), np.int32), np.empty((0, 3), np.int32)
+    return _scan_land_kernel(grid)
 
 class FarmingStrategy:
     """Smart farming strategy with market analysis and land management"""
     
     def __init__(self):
         self.crop_data = {}
-        self.market_history = []
+        self.market_history = deque(maxlen=60)  # Keep last hour of data
         self.land_data = None
         self.last_market_update = None
+        self._crop_lookup = {}
+        self._crop_lookup_source = None  # crop list the lookup was built from
+        self._last_market_response = None
+        self._last_market_analysis = None
+        self._last_market_snapshot = None
         
     def analyze_market(self, crops_response: Dict) -> Dict:
         """Analyze current market conditions and identify opportunities"""
         if 'crops' not in crops_response:
             return {}
         
+        # The API client returns the same response object until the market data changes
+        if crops_response is self._last_market_response:
+            self.market_history.append(self._last_market_snapshot)
+            return self._last_market_analysis
+        
         crops = crops_response['crops']
         market_info = crops_response.get('marketInfo', {})
+        self._get_crop_lookup(crops_response)
         
         analysis = {
-            'timestamp': datetime.now(),
+            'timestamp': time.monotonic_ns(),  # for ordering and age only
             'average_price': market_info.get('averagePrice', 0),
             'best_efficiency': market_info.get('bestEfficiency', 0),
             'opportunities': [],
@@ -33,51 +161,71 @@ class FarmingStrategy:
         }
         
         # Calculate average efficiency for comparison
-        avg_efficiency = sum(crop.get('efficiency', 0) for crop in crops) / len(crops)
+        views = [_crop_view(crop) for crop in crops]
+        soa = _vectorize_crops(views)
+        avg_efficiency = soa['efficiency'].mean()
         avg_price = market_info.get('averagePrice', 0)
         
+        # Classify every crop in one vectorized pass: 0=HIGH efficiency, 1=premium price,
+        # 2=affordable, 3=standard (first matching rule wins)
+        high = soa['efficiency'] > avg_efficiency * 1.2  # 20% above average
+        premium = ~high & (soa['price'] > avg_price * MARKET_PREMIUM_THRESHOLD)
+        affordable = ~high & ~premium & (soa['water'] <= 20)  # Affordable crops for quick planting
+        tiers = np.select([high, premium, affordable], [0, 1, 2], default=3)
+        
         # VICTORY MODE: Include more crop opportunities, not just premium ones
-        for crop in crops:
-            efficiency = crop.get('efficiency', 0)
-            market_price = crop.get('marketPrice', 0)
-            water_cost = crop.get('waterCost', 0)
+        for crop, view, tier in zip(crops, views, tiers.tolist()):
+            efficiency = view.efficiency
+            market_price = view.marketPrice
+            water_cost = view.waterCost
             
             # Add high-efficiency crops (premium)
-            if efficiency > avg_efficiency * 1.2:  # 20% above average
-                analysis['opportunities'].append({
-                    'crop': crop,
-                    'reason': f"High efficiency: {efficiency:.3f} (avg: {avg_efficiency:.3f})",
-                    'priority': 'HIGH'
-                })
+            if tier == 0:
+                analysis['opportunities'].append(Opportunity(
+                    crop=crop,
+                    reason=f"High efficiency: {efficiency:.3f} (avg: {avg_efficiency:.3f})",
+                    priority='HIGH',
+                    view=view
+                ))
             
             # Add premium-priced crops
-            elif market_price > avg_price * MARKET_PREMIUM_THRESHOLD:
-                analysis['opportunities'].append({
-                    'crop': crop,
-                    'reason': f"Premium price: {market_price:.2f} (avg: {avg_price:.2f})",
-                    'priority': 'MEDIUM'
-                })
+            elif tier == 1:
+                analysis['opportunities'].append(Opportunity(
+                    crop=crop,
+                    reason=f"Premium price: {market_price:.2f} (avg: {avg_price:.2f})",
+                    priority='MEDIUM',
+                    view=view
+                ))
             
             # VICTORY ADDITION: Add affordable crops for immediate planting
-            elif water_cost <= 20:  # Affordable crops for quick planting
-                analysis['opportunities'].append({
-                    'crop': crop,
-                    'reason': f"Affordable: {water_cost} water, {efficiency:.3f} efficiency",
-                    'priority': 'MEDIUM'
-                })
+            elif tier == 2:
+                analysis['opportunities'].append(Opportunity(
+                    crop=crop,
+                    reason=f"Affordable: {water_cost} water, {efficiency:.3f} efficiency",
+                    priority='MEDIUM',
+                    view=view
+                ))
             
             # VICTORY ADDITION: Add all remaining crops as backup options
             else:
-                analysis['opportunities'].append({
-                    'crop': crop,
-                    'reason': f"Standard crop: {water_cost} water, {efficiency:.3f} efficiency",
-                    'priority': 'LOW'
-                })
-        
-        # Store market history
-        self.market_history.append(analysis)
-        if len(self.market_history) > 60:  # Keep last hour of data
-            self.market_history.pop(0)
+                analysis['opportunities'].append(Opportunity(
+                    crop=crop,
+                    reason=f"Standard crop: {water_cost} water, {efficiency:.3f} efficiency",
+                    priority='LOW',
+                    view=view
+                ))
+        
+        # Store market history (the analysis itself references the full crop list, so keep a summary)
+        snapshot = HistoricalSnapshot(
+            timestamp=analysis['timestamp'],
+            average_price=avg_price,
+            average_efficiency=float(avg_efficiency),
+            opportunity_ids=tuple(opp.view.id for opp in analysis['opportunities'])
+        )
+        self.market_history.append(snapshot)
+        self._last_market_response = crops_response
+        self._last_market_analysis = analysis
+        self._last_market_snapshot = snapshot
         
         return analysis
     
@@ -92,7 +240,7 @@ class FarmingStrategy:
         elif land_size >= 1:  # 1 empty plot = ULTRA-AGGRESSIVE for victory
             min_reserve = 1  # Keep only 1 water - we need to plant!
         else:
-            min_reserve = max(5, MIN_WATER_RESERVE // 3)  # Normal mode when land is full
+            min_reserve = _FULL_LAND_RESERVE  # Normal mode when land is full
         
         if available_water < min_reserve:
             return None
@@ -112,89 +260,69 @@ class FarmingStrategy:
             if crops_data:
                 # Create basic opportunities from all crops
                 opportunities = [
-                    {'crop': crop, 'priority': 'MEDIUM', 'reason': 'Standard crop'}
+                    Opportunity(crop=crop, reason='Standard crop', priority='MEDIUM', view=_crop_view(crop))
                     for crop in crops_data
                 ]
         
         if not opportunities:
             return None
         
-        # Filter affordable crops
-        affordable_crops = [
-            opp for opp in opportunities 
-            if opp['crop'].get('waterCost', 0) <= affordable_water
-        ]
-        
-        if not affordable_crops:
+        # EMERGENCY PRIORITIZATION: For victory, prioritize credits per minute among affordable crops
+        soa = _vectorize_crops([opp.view for opp in opportunities])
+        affordable = np.flatnonzero(soa['water'] <= affordable_water)
+        if affordable.size == 0:
             return None
         
-        # EMERGENCY PRIORITIZATION: For victory, prioritize credits per minute!
-        # But also consider total credits to avoid micro-farming
-        def calculate_crop_score(crop_data):
-            crop = crop_data['crop']
-            grow_time_minutes = crop.get('growTimeMinutes', crop.get('growTimeHours', 1) * 60)
-            credits = crop.get('marketPrice', 0)
-            water_cost = crop.get('waterCost', 1)
-            
-            if grow_time_minutes <= 0:
-                return 0
-            
-            credits_per_minute = credits / grow_time_minutes
-            
-            # EMERGENCY: If we're behind, prioritize speed over total credits
-            # But avoid crops that give too few total credits
-            if credits < 0.5:  # Avoid micro-credit crops
-                return credits_per_minute * 0.1  # Heavy penalty
-            elif credits < 2.0:  # Small credit crops get moderate penalty
-                return credits_per_minute * 0.5
-            else:  # Good credit crops get full score
-                return credits_per_minute
-        
-        affordable_crops.sort(key=calculate_crop_score, reverse=True)
-        
-        return affordable_crops[0]['crop']
+        # argmax picks the first of equally scored crops, like the stable sort it replaces
+        best = affordable[_crop_scores(soa)[affordable].argmax()]
+        return opportunities[best].crop
     
-    def find_empty_plots(self, land_data: Dict) -> List[Tuple[int, int]]:
-        """Find empty plots on the farm"""
+    def _get_crop_lookup(self, crops_data: Dict) -> Dict:
+        """Crop lookup by ID, rebuilt only when a different crop list comes in"""
+        crops = crops_data.get('crops')
+        # The API client hands back the same cached list until the market changes
+        if crops is not self._crop_lookup_source:
+            self._crop_lookup = {crop.get('id'): crop for crop in crops or []}
+            self._crop_lookup_source = crops
+        return self._crop_lookup
+    
+    def attach_land(self, land_data: Dict) -> Dict:
+        """Convert freshly fetched land data's grid to int8 once so every scan can reuse it"""
+        land_data['_grid_np'] = np.asarray(land_data.get('landData', []), dtype=np.int8)
+        self.land_data = land_data
+        return land_data
+    
+    def scan_land(self, land_data: Dict, crops_data: Dict) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int, Dict]]]:
+        """Find empty plots and harvestable crops with one pass over the land grid"""
         if not land_data.get('landClaimed'):
-            return []
+            return [], []
         
-        empty_plots = []
-        grid_data = land_data.get('landData', [])
+        empty, mature = _scan_land(_land_grid(land_data))
+        empty_plots = [(row_idx, col_idx) for row_idx, col_idx in empty.tolist()]
+        if not len(mature):
+            return empty_plots, []
         
-        for row_idx, row in enumerate(grid_data):
-            for col_idx, cell in enumerate(row):
-                if cell == 0:  # Empty dirt
-                    empty_plots.append((row_idx, col_idx))
+        crop_lookup = self._get_crop_lookup(crops_data)
         
-        return empty_plots
+        # Based on documentation: 0=empty dirt, 1=sprout, 2+=mature crops
+        harvestable = []
+        for row_idx, col_idx, cell in mature.tolist():
+            crop_info = crop_lookup.get(cell)
+            if crop_info:
+                harvestable.append((row_idx, col_idx, crop_info))
+            else:
+                # If we can't identify the specific crop, still try to harvest
+                harvestable.append((row_idx, col_idx, {'name': 'Unknown Crop', 'id': cell}))
+        
+        return empty_plots, harvestable
+    
+    def find_empty_plots(self, land_data: Dict) -> List[Tuple[int, int]]:
+        """Find empty plots on the farm"""
+        return self.scan_land(land_data, {})[0]
     
     def find_harvestable_crops(self, land_data: Dict, crops_data: Dict) -> List[Tuple[int, int, Dict]]:
         """Find crops that are ready to harvest"""
-        if not land_data.get('landClaimed'):
-            return []
-        
-        harvestable = []
-        grid_data = land_data.get('landData', [])
-        
-        # Create crop lookup by ID
-        crop_lookup = {}
-        if 'crops' in crops_data:
-            for crop in crops_data['crops']:
-                crop_lookup[crop.get('id')] = crop
-        
-        for row_idx, row in enumerate(grid_data):
-            for col_idx, cell in enumerate(row):
-                # Based on documentation: 0=empty dirt, 1=sprout, 2+=mature crops
-                if cell >= 2:  # Mature crops (any ID 2 or higher)
-                    crop_info = crop_lookup.get(cell)
-                    if crop_info:
-                        harvestable.append((row_idx, col_idx, crop_info))
-                    else:
-                        # If we can't identify the specific crop, still try to harvest
-                        harvestable.append((row_idx, col_idx, {'name': 'Unknown Crop', 'id': cell}))
-        
-        return harvestable
+        return self.scan_land(land_data, crops_data)[1]
     
     def should_expand_land(self, profile: Dict, land_data: Dict) -> bool:
         """Determine if we should expand our land with emergency competitive analysis"""
@@ -223,19 +351,16 @@ class FarmingStrategy:
                 
             return current_water >= water_threshold
         
-        # Calculate expansion ROI for larger expansions
-        expansion_roi = self.calculate_expansion_roi(land_data, current_water)
-        
-        # Expansion strategy based on current situation
-        if current_land_tiles <= 9:  # 3×3 → 4×4 (adds 7 tiles)
-            # Good expansion, but be more conservative after getting 3×3
-            return (current_water >= next_expansion_cost + MIN_WATER_RESERVE and
-                    expansion_roi > 0.15)  # 15% ROI threshold
-        
+        # Good expansion after 3×3 but more conservative; beyond 4×4 only if extremely profitable
+        if current_land_tiles <= 9:
+            water_margin, roi_threshold = _EXPANSION_THRESHOLDS_3X3
         else:
-            # Beyond 4×4, only expand if extremely profitable
-            return (current_water >= next_expansion_cost + 50 and
-                    expansion_roi > 0.25)  # 25% ROI threshold
+            water_margin, roi_threshold = _EXPANSION_THRESHOLDS_LARGE
+        if current_water < next_expansion_cost + water_margin:
+            return False
+        
+        # Only worth working out the ROI once the water margin is met
+        return self.calculate_expansion_roi(land_data, current_water) > roi_threshold
     
     def calculate_expansion_roi(self, land_data: Dict, current_water: int) -> float:
         """Calculate the expected ROI from land expansion"""
@@ -245,27 +370,16 @@ class FarmingStrategy:
         if next_expansion_cost == float('inf'):
             return 0.0
         
-        # Calculate new tiles gained from expansion
-        if current_land_tiles == 1:    # 1x1 → 2x2
-            new_tiles = 3
-        elif current_land_tiles == 4:  # 2x2 → 3x3  
-            new_tiles = 5
-        elif current_land_tiles == 9:  # 3x3 → 4x4
-            new_tiles = 7
-        else:
-            # Estimate for larger expansions
+        # Calculate new tiles gained from expansion (estimate for larger expansions)
+        new_tiles = _EXPANSION_NEW_TILES.get(current_land_tiles)
+        if new_tiles is None:
             new_tiles = max(1, int(current_land_tiles * 0.5))
         
-        # Estimate credits per hour per tile (conservative estimate)
-        # Assume average crop: 8 water cost, 0.15 credits, 0.5 hour grow time
-        credits_per_tile_per_hour = 0.15 / 0.5  # 0.3 credits/hour per tile
-        
-        # Total additional credits per hour from expansion
-        additional_credits_per_hour = new_tiles * credits_per_tile_per_hour
+        # Total additional credits per hour from expansion (conservative estimate)
+        additional_credits_per_hour = new_tiles * _CREDITS_PER_TILE_PER_HOUR
         
         # Convert water cost to equivalent credit cost (rough estimate)
-        # Assume 1 water = 0.02 credits (based on water collection rate vs crop values)
-        expansion_cost_in_credits = next_expansion_cost * 0.02
+        expansion_cost_in_credits = next_expansion_cost * _WATER_TO_CREDITS
         
         # ROI = Annual return / Investment
         # Use 24 hours as the investment horizon
@@ -325,29 +439,29 @@ class FarmingStrategy:
         current_water = profile.get('score', 0)
         
         plan = {
-            'timestamp': datetime.now(),
+            'timestamp': time.monotonic_ns(),  # for ordering and age only
             'current_water': current_water,
             'actions': [],
             'market_summary': market_analysis
         }
         
-        # First, always check for harvestable crops (immediate credits!)
-        harvestable = self.find_harvestable_crops(land_data, crops_data)
+        # One pass over the grid: harvestable crops (immediate credits!) and empty plots
+        empty_plots, harvestable = self.scan_land(land_data, crops_data)
         harvestable_credits = len(harvestable) * 0.15  # Estimate credits from harvesting
         
-        # Find empty plots for future planning
-        empty_plots = self.find_empty_plots(land_data)
+        # Actions go straight into per-priority buckets, so the plan needs no final sort
+        buckets = {priority: [] for priority in PRIORITIES}
         
         # 1. PRIORITY: Harvest ready crops (immediate profit, frees up space)
         for row, col, crop_info in harvestable:
-            plan['actions'].append({
-                'type': 'harvest',
-                'priority': 'CRITICAL',  # Highest priority - immediate credits!
-                'row': row,
-                'col': col,
-                'crop': crop_info,
-                'description': f"Harvest {crop_info.get('name', 'crop')} at ({row},{col})"
-            })
+            buckets['CRITICAL'].append(Action(
+                type='harvest',
+                priority='CRITICAL',  # Highest priority - immediate credits!
+                row=row,
+                col=col,
+                crop=crop_info,
+                description=f"Harvest {crop_info.get('name', 'crop')} at ({row},{col})"
+            ))
         
         # 2. SMART EXPANSION LOGIC: Consider current situation
         should_expand = False
@@ -387,17 +501,18 @@ class FarmingStrategy:
         
         if should_expand:
             if not land_data.get('landClaimed'):
-                plan['actions'].append({
-                    'type': 'claim_land',
-                    'priority': 'HIGH',
-                    'description': 'Claim first plot of farming land'
-                })
+                buckets['HIGH'].append(Action(
+                    type='claim_land',
+                    priority='HIGH',
+                    description='Claim first plot of farming land'
+                ))
             else:
-                plan['actions'].append({
-                    'type': 'expand_land',
-                    'priority': 'HIGH' if not empty_plots else 'MEDIUM',  # Higher priority if no space
-                    'description': f"Expand land (cost: {land_data.get('nextExpansionCost', 'unknown')}) - {expansion_reasoning}"
-                })
+                expand_priority = 'HIGH' if not empty_plots else 'MEDIUM'  # Higher priority if no space
+                buckets[expand_priority].append(Action(
+                    type='expand_land',
+                    priority=expand_priority,
+                    description=f"Expand land (cost: {land_data.get('nextExpansionCost', 'unknown')}) - {expansion_reasoning}"
+                ))
         
         # 3. PLANTING: Fill available space efficiently
         if empty_plots:
@@ -414,17 +529,16 @@ class FarmingStrategy:
                 else:
                     plant_priority = 'MEDIUM'  # Normal planting
                 
-                plan['actions'].append({
-                    'type': 'plant',
-                    'priority': plant_priority,
-                    'row': row,
-                    'col': col,
-                    'crop': recommended_crop,
-                    'description': f"Plant {recommended_crop.get('name')} at ({row},{col}) - {recommended_crop.get('waterCost')} water"
-                })
-        
-        # Sort actions by priority: CRITICAL > HIGH > MEDIUM > LOW
-        priority_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        plan['actions'].sort(key=lambda x: priority_order.get(x.get('priority', 'MEDIUM'), 2))
+                buckets[plant_priority].append(Action(
+                    type='plant',
+                    priority=plant_priority,
+                    row=row,
+                    col=col,
+                    crop=recommended_crop,
+                    description=f"Plant {recommended_crop.get('name')} at ({row},{col}) - {recommended_crop.get('waterCost')} water"
+                ))
+        
+        # Actions by priority: CRITICAL > HIGH > MEDIUM > LOW
+        plan['actions'] = [action for priority in PRIORITIES for action in buckets[priority]]
         
         return plan 
\ No newline at end of file
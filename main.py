@@ -15,6 +15,7 @@ Features:
 import argparse
 import sys
 import os
+import time
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.panel import Panel
@@ -42,15 +43,14 @@ Ready to dominate the leaderboard? Let's farm! 🌱
 
 def get_farmer_credentials():
     """Get farmer credentials from user or environment"""
-    farmer_name = FARMER_NAME
-    client_id = CLIENT_ID
-    client_secret = CLIENT_SECRET
+    if FARMER_NAME:
+        return FARMER_NAME, CLIENT_ID, CLIENT_SECRET
     
-    if not farmer_name:
-        console.print("[yellow]👋 Welcome to HappyHarvest![/yellow]")
-        farmer_name = Prompt.ask("Enter your farmer name", default="farmer_" + str(int(time.time())))
+    console.print("[yellow]👋 Welcome to HappyHarvest![/yellow]")
+    default_name = f"farmer_{int(time.time())}"  # Only built when we actually have to ask
+    farmer_name = Prompt.ask("Enter your farmer name", default=default_name)
     
-    return farmer_name, client_id, client_secret
+    return farmer_name, CLIENT_ID, CLIENT_SECRET
 
 def main():
     parser = argparse.ArgumentParser(description="HappyHarvest Farming Bot")
@@ -110,5 +110,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    import time
     main() 
\ No newline at end of file
@@ -4,10 +4,16 @@ HappyHarvest Market Analyzer
 Standalone tool for analyzing crop markets and farming strategies
 """
 
+import os
 import time
+import heapq
+import hashlib
 import argparse
+import orjson
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -17,35 +23,109 @@ from rich.live import Live
 from api_client import HappyHarvestAPI
 from utils import display_crop_market_table
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy scorer below is used instead
+    njit = None
+
 console = Console()
 
+ANALYSIS_CACHE_SIZE = 128  # distinct crop listings whose analysis is kept
+ANALYSIS_CACHE_DIR = os.path.expanduser('~/.cache/happyharvest/analysis')  # shared across runs
+ANALYSIS_DISK_CACHE_SIZE = 1024  # files kept on disk, least recently used removed first
+ANALYSIS_CACHE_VERSION = 1  # bump whenever _compute_market_conditions or its output format changes
+MINUTES_PER_HOUR = 60.0
+ARBITRAGE_VECTORIZE_MIN = 32  # below this many crops a plain loop beats building arrays
+
+def _compact(values: np.ndarray) -> np.ndarray:
+    """Store a float64 column as int16 or float32 when that holds every value exactly"""
+    if not np.isnan(values).any() and np.all(np.abs(values) <= np.iinfo(np.int16).max):
+        narrow = values.astype(np.int16)
+        if np.array_equal(narrow, values):
+            return narrow
+    narrow = values.astype(np.float32)
+    if np.array_equal(narrow, values, equal_nan=True):
+        return narrow
+    return values
+
+def _crop_columns(crops: List[Dict]) -> Dict[str, np.ndarray]:
+    """Numeric crop fields as parallel compact columns (struct-of-arrays); NaN grow time = not reported"""
+    count = len(crops)
+    
+    def column(field, default):
+        return _compact(np.fromiter((crop.get(field, default) for crop in crops), dtype=np.float64, count=count))
+    
+    return {
+        'price': column('marketPrice', 0),
+        'efficiency': column('efficiency', 0),
+        'water': column('waterCost', 0),
+        'grow_time': column('growTimeMinutes', np.nan),
+    }
+
+def _arbitrage_scores_loop(water, price, efficiency, grow_time, inv_avg_price, inv_avg_efficiency, max_water):
+    """Score every crop in one loop, returning (selected indices, scores, premiums, bonuses, time factors)"""
+    count = price.shape[0]
+    price_premium = np.ones(count)
+    efficiency_bonus = np.ones(count)
+    time_factor = np.zeros(count)
+    scores = np.zeros(count)
+    selected = np.empty(count, np.int64)
+    n_selected = 0
+    for i in range(count):
+        if inv_avg_price != 0.0:
+            price_premium[i] = price[i] * inv_avg_price
+        if inv_avg_efficiency != 0.0:
+            efficiency_bonus[i] = efficiency[i] * inv_avg_efficiency
+        if grow_time[i] > 0:
+            time_factor[i] = MINUTES_PER_HOUR / grow_time[i]
+        scores[i] = price_premium[i] * efficiency_bonus[i] * time_factor[i]
+        if water[i] <= max_water and scores[i] > 1.2:  # 20% above average
+            selected[n_selected] = i
+            n_selected += 1
+    return selected[:n_selected], scores, price_premium, efficiency_bonus, time_factor
+
+def _arbitrage_scores_numpy(water, price, efficiency, grow_time, inv_avg_price, inv_avg_efficiency, max_water):
+    """Same result as _arbitrage_scores_loop using whole-array operations"""
+    count = price.shape[0]
+    price_premium = price * inv_avg_price if inv_avg_price else np.ones(count)
+    efficiency_bonus = efficiency * inv_avg_efficiency if inv_avg_efficiency else np.ones(count)
+    time_factor = np.divide(MINUTES_PER_HOUR, grow_time, out=np.zeros(count), where=grow_time > 0)
+    scores = price_premium * efficiency_bonus * time_factor
+    selected = np.flatnonzero((water <= max_water) & (scores > 1.2))  # 20% above average
+    return selected, scores, price_premium, efficiency_bonus, time_factor
+
+_arbitrage_scores = njit(cache=True)(_arbitrage_scores_loop) if njit else _arbitrage_scores_numpy
+
 class MarketAnalyzer:
     """Analyzes HappyHarvest crop markets and provides insights"""
     
     def __init__(self):
         self.api = HappyHarvestAPI()
-        self.price_history = []
-        self.analysis_cache = {}
+        self.price_history = deque(maxlen=100)  # Keep last 100 snapshots
+        self.analysis_cache = {}  # crop listing key -> analysis, oldest first
     
     def get_market_snapshot(self) -> Dict:
         """Get current market snapshot"""
         try:
-            crops_data = self.api.get_crops()
+            # Always hit the API: the caller chooses the polling interval
+            crops_data = self.api.get_crops(max_age=0)
             
             if 'crops' not in crops_data:
                 return {}
             
+            cols = _crop_columns(crops_data['crops'])
             snapshot = {
                 'timestamp': datetime.now(),
-                'crops': crops_data['crops'],
+                'crops': crops_data['crops'],  # kept for display
+                'cols': cols,
+                # Indexed once here so trend comparisons can look crops up directly
+                'by_type': {crop.get('type'): crop for crop in crops_data['crops']},
                 'market_info': crops_data.get('marketInfo', {}),
-                'analysis': self._analyze_market_conditions(crops_data)
+                'analysis': self._analyze_market_conditions(crops_data, cols)
             }
             
             # Store in price history
             self.price_history.append(snapshot)
-            if len(self.price_history) > 100:  # Keep last 100 snapshots
-                self.price_history.pop(0)
             
             return snapshot
             
@@ -53,45 +133,94 @@ class MarketAnalyzer:
             console.print(f"[red]Failed to get market data: {e}[/red]")
             return {}
     
-    def _analyze_market_conditions(self, crops_data: Dict) -> Dict:
-        """Analyze current market conditions"""
+    def _analyze_market_conditions(self, crops_data: Dict, cols: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+        """Analyze current market conditions, reusing the result for an unchanged crop listing"""
         crops = crops_data.get('crops', [])
-        market_info = crops_data.get('marketInfo', {})
         
         if not crops:
             return {}
         
-        # Calculate statistics
-        prices = [crop.get('marketPrice', 0) for crop in crops]
-        efficiencies = [crop.get('efficiency', 0) for crop in crops]
-        water_costs = [crop.get('waterCost', 0) for crop in crops]
-        
-        analysis = {
-            'total_crops': len(crops),
-            'price_stats': {
-                'min': min(prices),
-                'max': max(prices),
-                'avg': sum(prices) / len(prices),
-                'median': sorted(prices)[len(prices)//2]
-            },
-            'efficiency_stats': {
-                'min': min(efficiencies),
-                'max': max(efficiencies),
-                'avg': sum(efficiencies) / len(efficiencies),
-                'median': sorted(efficiencies)[len(efficiencies)//2]
-            },
-            'cost_stats': {
-                'min': min(water_costs),
-                'max': max(water_costs),
-                'avg': sum(water_costs) / len(water_costs),
-                'median': sorted(water_costs)[len(water_costs)//2]
+        key = self._listing_key(crops)
+        analysis = self.analysis_cache.get(key)
+        if analysis is None:
+            digest = hashlib.sha256(orjson.dumps((ANALYSIS_CACHE_VERSION, key))).hexdigest()
+            analysis = self._load_disk_analysis(digest)
+            if analysis is None:
+                analysis = self._compute_market_conditions(crops, cols if cols is not None else _crop_columns(crops))
+                self._store_disk_analysis(digest, analysis)
+            if len(self.analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                del self.analysis_cache[next(iter(self.analysis_cache))]
+            self.analysis_cache[key] = analysis
+        return analysis
+    
+    @staticmethod
+    def _listing_key(crops: List[Dict]) -> tuple:
+        """Hashable fingerprint of everything the analysis and its displays read from each crop"""
+        return tuple(
+            (crop.get('id'), crop.get('type'), crop.get('name'), crop.get('emoji'), crop.get('marketPrice', 0),
+             crop.get('efficiency', 0), crop.get('waterCost', 0), crop.get('growTimeMinutes'))
+            for crop in crops
+        )
+    
+    @staticmethod
+    def _load_disk_analysis(digest: str) -> Optional[Dict]:
+        """Analysis saved by an earlier run for the same listing, or None"""
+        path = os.path.join(ANALYSIS_CACHE_DIR, digest + '.json')
+        try:
+            with open(path, 'rb') as f:
+                analysis = orjson.loads(f.read())
+            os.utime(path)  # mark as recently used
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        return analysis
+    
+    @staticmethod
+    def _store_disk_analysis(digest: str, analysis: Dict):
+        """Save an analysis for later runs; the disk cache is best effort and never raises"""
+        try:
+            os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+            path = os.path.join(ANALYSIS_CACHE_DIR, digest + '.json')
+            # Write then rename, so a concurrent analyzer never reads a half-written file
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(analysis))
+            os.replace(temp_path, path)
+            
+            entries = [entry for entry in os.scandir(ANALYSIS_CACHE_DIR) if entry.name.endswith('.json')]
+            if len(entries) > ANALYSIS_DISK_CACHE_SIZE:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[:len(entries) - ANALYSIS_DISK_CACHE_SIZE]:
+                    os.remove(entry.path)
+        except (OSError, TypeError):
+            pass
+    
+    def _compute_market_conditions(self, crops: List[Dict], cols: Dict[str, np.ndarray]) -> Dict:
+        """Statistics and top picks for a non-empty crop list and its columns"""
+        # Calculate statistics: one row per crop, columns are price, efficiency, water cost
+        values = np.column_stack((cols['price'], cols['efficiency'], cols['water'])).astype(np.float64)
+        middle = len(crops) // 2
+        mins = values.min(axis=0).tolist()
+        maxs = values.max(axis=0).tolist()
+        avgs = values.mean(axis=0).tolist()
+        medians = np.partition(values, middle, axis=0)[middle].tolist()  # upper median, no full sort
+        
+        analysis = {'total_crops': len(crops)}
+        for column, name in enumerate(('price_stats', 'efficiency_stats', 'cost_stats')):
+            analysis[name] = {
+                'min': mins[column],
+                'max': maxs[column],
+                'avg': avgs[column],
+                'median': medians[column]
             }
-        }
         
-        # Find best opportunities
-        analysis['top_efficiency'] = sorted(crops, key=lambda x: x.get('efficiency', 0), reverse=True)[:5]
-        analysis['best_value'] = sorted(crops, key=lambda x: x.get('marketPrice', 0), reverse=True)[:5]
-        analysis['quick_turnaround'] = sorted(crops, key=lambda x: x.get('growTimeMinutes', 999))[:5]
+        # Find best opportunities (top 5 of each without sorting the whole list)
+        efficiency = cols['efficiency'].tolist()
+        price = cols['price'].tolist()
+        grow_time = np.where(np.isnan(cols['grow_time']), 999, cols['grow_time']).tolist()  # unreported sorts last
+        indices = range(len(crops))
+        analysis['top_efficiency'] = [crops[i] for i in heapq.nlargest(5, indices, key=efficiency.__getitem__)]
+        analysis['best_value'] = [crops[i] for i in heapq.nlargest(5, indices, key=price.__getitem__)]
+        analysis['quick_turnaround'] = [crops[i] for i in heapq.nsmallest(5, indices, key=grow_time.__getitem__)]
         
         return analysis
     
@@ -121,32 +250,22 @@ class MarketAnalyzer:
         opportunities_table.add_column("Crop", style="yellow")
         opportunities_table.add_column("Value", style="green")
         
-        # Best efficiency crops
-        top_efficiency = analysis.get('top_efficiency', [])[:3]
-        for i, crop in enumerate(top_efficiency):
-            opportunities_table.add_row(
-                "High Efficiency" if i == 0 else "",
-                f"{crop.get('emoji', '🌱')} {crop.get('name', 'Unknown')}",
-                f"{crop.get('efficiency', 0):.3f}"
-            )
-        
-        # Best value crops
-        best_value = analysis.get('best_value', [])[:3]
-        for i, crop in enumerate(best_value):
-            opportunities_table.add_row(
-                "High Value" if i == 0 else "",
-                f"{crop.get('emoji', '🌱')} {crop.get('name', 'Unknown')}",
-                f"{crop.get('marketPrice', 0):.2f} credits"
+        # Best efficiency, best value and quick turnaround crops: format every row first
+        rows = []
+        for category, crops, field, template in (
+            ("High Efficiency", analysis.get('top_efficiency', []), 'efficiency', "{:.3f}"),
+            ("High Value", analysis.get('best_value', []), 'marketPrice', "{:.2f} credits"),
+            ("Quick Growth", analysis.get('quick_turnaround', []), 'growTimeMinutes', "{}min"),
+        ):
+            rows.extend(
+                ("" if i else category,
+                 f"{crop.get('emoji', '🌱')} {crop.get('name', 'Unknown')}",
+                 template.format(crop.get(field, 0)))
+                for i, crop in enumerate(crops[:3])
             )
         
-        # Quick turnaround crops
-        quick_crops = analysis.get('quick_turnaround', [])[:3]
-        for i, crop in enumerate(quick_crops):
-            opportunities_table.add_row(
-                "Quick Growth" if i == 0 else "",
-                f"{crop.get('emoji', '🌱')} {crop.get('name', 'Unknown')}",
-                f"{crop.get('growTimeMinutes', 0)}min"
-            )
+        for row in rows:
+            opportunities_table.add_row(*row)
         
         # Display in columns
         console.print(Columns([Panel(summary_table), Panel(opportunities_table)]))
@@ -167,8 +286,8 @@ class MarketAnalyzer:
         trends_table.add_column("Change", style="yellow")
         trends_table.add_column("Trend", style="magenta")
         
-        current_crops = {crop['type']: crop for crop in current.get('crops', [])}
-        previous_crops = {crop['type']: crop for crop in previous.get('crops', [])}
+        current_crops = current.get('by_type', {})
+        previous_crops = previous.get('by_type', {})
         
         for crop_type, crop in current_crops.items():
             if crop_type in previous_crops:
@@ -188,9 +307,10 @@ class MarketAnalyzer:
         
         console.print(trends_table)
     
-    def find_arbitrage_opportunities(self, max_water: int = 100) -> List[Dict]:
-        """Find potential arbitrage opportunities"""
-        snapshot = self.get_market_snapshot()
+    def find_arbitrage_opportunities(self, max_water: int = 100, snapshot: Optional[Dict] = None) -> List[Dict]:
+        """Find potential arbitrage opportunities in the given snapshot (fetched if not given)"""
+        if snapshot is None:
+            snapshot = self.get_market_snapshot()
         if not snapshot:
             return []
         
@@ -200,6 +320,17 @@ class MarketAnalyzer:
         avg_price = analysis.get('price_stats', {}).get('avg', 0)
         avg_efficiency = analysis.get('efficiency_stats', {}).get('avg', 0)
         
+        # The averages are the same for every crop: divide once, multiply per crop
+        inv_avg_price = 1.0 / avg_price if avg_price > 0 else 0.0
+        inv_avg_efficiency = 1.0 / avg_efficiency if avg_efficiency > 0 else 0.0
+        
+        if len(crops) < ARBITRAGE_VECTORIZE_MIN:
+            return self._score_arbitrage_loop(crops, max_water, inv_avg_price, inv_avg_efficiency)
+        return self._score_arbitrage_arrays(crops, snapshot['cols'], max_water, inv_avg_price, inv_avg_efficiency)
+    
+    def _score_arbitrage_loop(self, crops: List[Dict], max_water: int,
+                              inv_avg_price: float, inv_avg_efficiency: float) -> List[Dict]:
+        """Score arbitrage opportunities crop by crop (cheapest for short crop lists)"""
         opportunities = []
         
         for crop in crops:
@@ -210,9 +341,9 @@ class MarketAnalyzer:
             
             if water_cost <= max_water:
                 # Calculate opportunity score
-                price_premium = market_price / avg_price if avg_price > 0 else 1
-                efficiency_bonus = efficiency / avg_efficiency if avg_efficiency > 0 else 1
-                time_factor = 60 / grow_time if grow_time > 0 else 0
+                price_premium = market_price * inv_avg_price if inv_avg_price else 1
+                efficiency_bonus = efficiency * inv_avg_efficiency if inv_avg_efficiency else 1
+                time_factor = MINUTES_PER_HOUR / grow_time if grow_time > 0 else 0
                 
                 opportunity_score = (price_premium * efficiency_bonus * time_factor)
                 
@@ -227,9 +358,38 @@ class MarketAnalyzer:
         
         return sorted(opportunities, key=lambda x: x['score'], reverse=True)
     
-    def display_arbitrage_opportunities(self, max_water: int = 100):
+    def _score_arbitrage_arrays(self, crops: List[Dict], cols: Dict[str, np.ndarray], max_water: int,
+                                inv_avg_price: float, inv_avg_efficiency: float) -> List[Dict]:
+        """Score arbitrage opportunities for all crops at once (JIT-compiled when numba is installed)"""
+        # An unreported (NaN) grow time fails the grow_time > 0 test, so it scores 0 as before
+        # Columns may be stored narrow; score in float64 so results match the per-crop loop
+        water, price, efficiency, grow_time = (
+            cols[name].astype(np.float64) for name in ('water', 'price', 'efficiency', 'grow_time')
+        )
+        selected, scores, price_premium, efficiency_bonus, time_factor = _arbitrage_scores(
+            water, price, efficiency, grow_time, inv_avg_price, inv_avg_efficiency, float(max_water)
+        )
+        
+        # Best first (stable, like sorted(..., reverse=True))
+        order = selected[np.argsort(-scores[selected], kind='stable')]
+        
+        return [
+            {
+                'crop': crops[index],
+                'score': score,
+                'price_premium': premium,
+                'efficiency_bonus': bonus,
+                'time_factor': factor
+            }
+            for index, score, premium, bonus, factor in zip(
+                order.tolist(), scores[order].tolist(), price_premium[order].tolist(),
+                efficiency_bonus[order].tolist(), time_factor[order].tolist()
+            )
+        ]
+    
+    def display_arbitrage_opportunities(self, max_water: int = 100, snapshot: Optional[Dict] = None):
         """Display arbitrage opportunities"""
-        opportunities = self.find_arbitrage_opportunities(max_water)
+        opportunities = self.find_arbitrage_opportunities(max_water, snapshot)
         
         if not opportunities:
             console.print(f"[yellow]No strong arbitrage opportunities found with {max_water} water budget[/yellow]")
@@ -242,15 +402,19 @@ class MarketAnalyzer:
         arb_table.add_column("💰 Price", justify="right", style="green")
         arb_table.add_column("📊 Score", justify="right", style="yellow")
         
+        rows = []
         for opp in opportunities[:10]:  # Top 10
             crop = opp['crop']
-            arb_table.add_row(
+            rows.append((
                 f"{crop.get('emoji', '🌱')} {crop.get('name', 'Unknown')}",
                 str(crop.get('waterCost', 0)),
                 f"{crop.get('growTimeMinutes', 0)}min",
                 f"{crop.get('marketPrice', 0):.2f}",
                 f"{opp['score']:.2f}"
-            )
+            ))
+        
+        for row in rows:
+            arb_table.add_row(*row)
         
         console.print(arb_table)
     
@@ -267,18 +431,29 @@ class MarketAnalyzer:
             self.display_market_overview(snapshot)
             return Panel("Market data refreshed", title=f"Last Update: {datetime.now().strftime('%H:%M:%S')}")
         
+        last_key = None
+        deadline = time.monotonic()
         try:
             while True:
                 snapshot = self.get_market_snapshot()
                 if snapshot:
-                    console.clear()
-                    self.display_market_overview(snapshot)
-                    self.display_arbitrage_opportunities()
-                    if len(self.price_history) >= 2:
-                        self.display_price_trends()
+                    key = self._listing_key(snapshot['crops'])
+                    if key != last_key:
+                        console.clear()
+                        self.display_market_overview(snapshot)
+                        self.display_arbitrage_opportunities(snapshot=snapshot)
+                        if len(self.price_history) >= 2:
+                            self.display_price_trends()
+                        last_key = key
+                    else:
+                        # Same listing as on screen: skip the full redraw
+                        console.print(f"[dim]{datetime.now().strftime('%H:%M:%S')} Market unchanged[/dim]")
                 
+                # Schedule against a fixed cadence so fetch/render time doesn't accumulate as drift;
+                # after an overrun, restart from now instead of firing back-to-back updates
+                deadline = max(deadline + update_interval, time.monotonic())
                 console.print(f"\n[dim]Next update in {update_interval} seconds... (Ctrl+C to stop)[/dim]")
-                time.sleep(update_interval)
+                time.sleep(max(0.0, deadline - time.monotonic()))
                 
         except KeyboardInterrupt:
             console.print("\n[yellow]Market monitoring stopped[/yellow]")
@@ -310,7 +485,7 @@ def main():
         analyzer.display_market_overview(snapshot)
         
         console.print()
-        analyzer.display_arbitrage_opportunities(args.budget)
+        analyzer.display_arbitrage_opportunities(args.budget, snapshot)
         
         console.print(f"\n[dim]Use --live for continuous monitoring[/dim]")
 
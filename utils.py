@@ -1,5 +1,8 @@
+import sys
 import time
-import json
+import orjson
+from functools import lru_cache
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 from rich.console import Console
@@ -7,6 +10,36 @@ from rich.table import Table
 
 console = Console()
 
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 on
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Emoji for each land state, indexed by cell value
+LAND_EMOJIS = (
+    "🟫",  # Empty dirt
+    "🌱",  # Sprout
+    "🌿",  # Herb
+    "🥬",  # Lettuce
+    "🧅",  # Onion
+    "🫛",  # Peas
+    "🫘",  # Bean
+    "🍅",  # Tomato
+    "🍓",  # Strawberry
+    "🌽",  # Corn
+    "🥔",  # Potato
+    "🥕",  # Carrot
+    "🍄",  # Mushroom
+    "🍆",  # Eggplant
+    "🌾",  # Wheat
+    "🍉",  # Watermelon
+    "🎃",  # Pumpkin
+    "🌶️",  # Chili
+    "🥒",  # Cucumber
+    "🥦",  # Broccoli
+    "🌻",  # Sunflower
+)
+
+@lru_cache(maxsize=1024)
 def format_duration(seconds: int) -> str:
     """Format seconds into a human-readable duration"""
     if seconds < 60:
@@ -20,11 +53,12 @@ def format_duration(seconds: int) -> str:
         remaining_minutes = (seconds % 3600) // 60
         return f"{hours}h {remaining_minutes}m"
 
+@lru_cache(maxsize=1024)
 def format_timestamp(timestamp_str: str) -> str:
     """Format ISO timestamp to human-readable format"""
     try:
-        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d %H:%M:%S')
+        iso = timestamp_str if FROMISOFORMAT_ACCEPTS_Z else timestamp_str.replace('Z', '+00:00')
+        return datetime.fromisoformat(iso).strftime(TIMESTAMP_FORMAT)
     except:
         return timestamp_str
 
@@ -51,6 +85,7 @@ def display_crop_market_table(crops_data: Dict):
     # Sort crops by efficiency (descending)
     crops = sorted(crops_data['crops'], key=lambda x: x.get('efficiency', 0), reverse=True)
     
+    rows = []
     for crop in crops[:10]:  # Show top 10
         water_cost = crop.get('waterCost', 0)
         grow_time = crop.get('growTimeMinutes', 0)
@@ -63,14 +98,18 @@ def display_crop_market_table(crops_data: Dict):
         else:
             roi_per_hour = 0
         
-        table.add_row(
+        rows.append((
             f"{crop.get('emoji', '🌱')} {crop.get('name', 'Unknown')}",
             str(water_cost),
             f"{grow_time}min",
             f"{price:.2f}",
             f"{efficiency:.3f}",
             f"{roi_per_hour:.2f}"
-        )
+        ))
+    
+    # All rows are formatted before Rich sees any of them
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -85,59 +124,26 @@ def display_land_visualization(land_data: Dict):
     
     console.print(f"\n[cyan]🏞️ Your Farm ({grid_size}×{grid_size})[/cyan]")
     
-    # Emoji mapping for land states
-    land_emojis = {
-        0: "🟫",  # Empty dirt
-        1: "🌱",  # Sprout
-        2: "🌿",  # Herb
-        3: "🥬",  # Lettuce
-        4: "🧅",  # Onion
-        5: "🫛",  # Peas
-        6: "🫘",  # Bean
-        7: "🍅",  # Tomato
-        8: "🍓",  # Strawberry
-        9: "🌽",  # Corn
-        10: "🥔", # Potato
-        11: "🥕", # Carrot
-        12: "🍄", # Mushroom
-        13: "🍆", # Eggplant
-        14: "🌾", # Wheat
-        15: "🍉", # Watermelon
-        16: "🎃", # Pumpkin
-        17: "🌶️", # Chili
-        18: "🥒", # Cucumber
-        19: "🥦", # Broccoli
-        20: "🌻", # Sunflower
-    }
-    
     for row in grid_data:
-        row_display = ""
-        for cell in row:
-            emoji = land_emojis.get(cell, "❓")
-            row_display += emoji + " "
-        console.print(row_display)
+        console.print(" ".join(LAND_EMOJIS[cell] if 0 <= cell < len(LAND_EMOJIS) else "❓" for cell in row))
 
 def save_bot_state(bot_state: Dict, filename: str = "bot_state.json"):
     """Save bot state to file"""
     try:
-        # Convert datetime objects to strings
-        state = bot_state.copy()
-        if 'start_time' in state:
-            state['start_time'] = state['start_time'].isoformat()
-        
-        with open(filename, 'w') as f:
-            json.dump(state, f, indent=2)
+        # orjson writes datetimes (e.g. start_time) as ISO 8601 strings itself
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(bot_state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     except Exception as e:
         console.print(f"[red]Failed to save bot state: {e}[/red]")
 
 def load_bot_state(filename: str = "bot_state.json") -> Dict:
     """Load bot state from file"""
     try:
-        with open(filename, 'r') as f:
-            state = json.load(f)
+        with open(filename, 'rb') as f:
+            state = orjson.loads(f.read())
         
         # Convert string back to datetime
-        if 'start_time' in state:
+        if isinstance(state.get('start_time'), str):
             state['start_time'] = datetime.fromisoformat(state['start_time'])
         
         return state
@@ -154,25 +160,17 @@ def estimate_next_harvest(land_data: Dict, crops_data: Dict) -> List[Dict]:
     
     # This is a simplified version - in reality, we'd need to track planting times
     # For now, we'll just identify what crops are growing
-    grid_data = land_data.get('landData', [])
-    growing_crops = []
-    
-    crop_lookup = {}
-    if 'crops' in crops_data:
-        for crop in crops_data['crops']:
-            crop_lookup[crop.get('id')] = crop
-    
-    for row_idx, row in enumerate(grid_data):
-        for col_idx, cell in enumerate(row):
-            if cell == 1:  # Sprout (growing)
-                growing_crops.append({
-                    'row': row_idx,
-                    'col': col_idx,
-                    'status': 'growing',
-                    'estimated_harvest': 'unknown'
-                })
-    
-    return growing_crops
+    # Reuse the int8 grid FarmingStrategy.attach_land stores, if present
+    grid = land_data.get('_grid_np')
+    if grid is None:
+        grid = np.asarray(land_data.get('landData', []), dtype=np.int8)
+    if grid.ndim != 2:
+        return []
+    
+    return [
+        {'row': row, 'col': col, 'status': 'growing', 'estimated_harvest': 'unknown'}
+        for row, col in np.argwhere(grid == 1).tolist()  # Sprouts (growing)
+    ]
 
 def check_api_rate_limit(last_call_time: datetime, min_interval: int) -> bool:
     """Check if enough time has passed since last API call"""